@@ -3,12 +3,14 @@
 import logging
 from dataclasses import InitVar, dataclass, field
 from enum import Enum
-from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+from typing import Dict, List, NamedTuple, Optional, Tuple, Type, TypeVar, Union
 
 from bimmer_connected.const import DEFAULT_POI_NAME
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T", bound="StrEnum")
+
 
 class StrEnum(str, Enum):
     """A string enumeration of type `(str, Enum)`. All members are compared via `upper()`. Defaults to UNKNOWN."""
@@ -26,6 +28,11 @@ class StrEnum(str, Enum):
             return getattr(cls, "UNKNOWN")
         raise ValueError(f"'{value}' is not a valid {cls.__name__}")
 
+    @classmethod
+    def from_value(cls: Type[_T], value: str) -> _T:
+        """Get a member by value, trying an exact match before the case-insensitive lookup."""
+        return cls._value2member_map_.get(value) or cls(value)  # type: ignore[return-value]
+
 
 @dataclass
 class VehicleDataBase:
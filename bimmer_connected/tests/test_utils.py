@@ -11,6 +11,7 @@ import pytest
 import respx
 import time_machine
 
+from bimmer_connected import utils
 from bimmer_connected.api.utils import get_capture_position
 from bimmer_connected.models import ChargingSettings, ValueWithUnit
 from bimmer_connected.utils import MyBMWJSONEncoder, get_class_property_names, parse_datetime
@@ -64,12 +65,61 @@ def test_parse_datetime(caplog):
 
     assert dt_without_milliseconds == parse_datetime("2021-11-12T16:14:15+03:00")
 
+    # Repeated inputs give the same result
+    assert dt_without_milliseconds == parse_datetime("2021-11-12T13:14:15Z")
+
+    assert parse_datetime("") is None
+    assert parse_datetime(None) is None
+    assert parse_datetime("None") is None
+    assert len([r for r in caplog.records if r.levelname == "ERROR"]) == 0
+
     unparseable_datetime = "2021-14-12T13:14:15Z"
     assert parse_datetime(unparseable_datetime) is None
     errors = [r for r in caplog.records if r.levelname == "ERROR" and unparseable_datetime in r.message]
     assert len(errors) == 1
 
 
+@pytest.mark.parametrize("use_fromisoformat", [True, False])
+def test_parse_datetime_fast_path(monkeypatch: pytest.MonkeyPatch, use_fromisoformat: bool):
+    """Test the ISO-8601 parser with and without `datetime.fromisoformat`."""
+    if use_fromisoformat and not utils._HAS_C_FROMISOFORMAT:
+        pytest.skip("datetime.fromisoformat does not support all formats before Python 3.11")
+    monkeypatch.setattr(utils, "_HAS_C_FROMISOFORMAT", use_fromisoformat)
+
+    expected = datetime.datetime(2021, 11, 12, 13, 14, 15, tzinfo=datetime.timezone.utc)
+    for date_str in [
+        "2021-11-12T13:14:15.567Z",
+        "2021-11-12T13:14:15Z",
+        "2021-11-12T16:14:15+03:00",
+        "2021-11-12T16:14:15.123+03:00",
+        "2021-11-12T10:44:15-02:30",
+    ]:
+        assert expected == utils._fast_parse_iso(date_str)
+
+    for date_str in [
+        "2021-14-12T13:14:15Z",
+        "2021-11-12T13:14:15",
+        "2021-11-12 13:14:15Z",
+        "2021-11-12",
+        "2021-11-12T13:14Z",
+        "2021-11-12T13Z",
+        "2021-11-12T131415Z",
+        "2021-11-12T16:14:15+03",
+        "2021-11-12T13:14:15,5Z",
+        "2021-11-12T16:14:15 +0300",
+        "2021-11-12T13:14:15.1234567Z",
+        "2021-11-12T13:14: 5Z",
+        "2021-+1-12T13:14:15Z",
+        "2021-11-12T16:14:15+ 3:00",
+        "2021-11-12T16:14:15+03:-0",
+        "2021-11-12T16:14:15+03:60",
+        "2021-11-12T13:14:١5Z",
+        "2021-11-12T13:14:15.²Z",
+    ]:
+        with pytest.raises((ValueError, IndexError)):
+            utils._fast_parse_iso(date_str)
+
+
 @time_machine.travel(
     datetime.datetime(2011, 11, 28, tzinfo=zoneinfo.ZoneInfo("America/Los_Angeles")),
     tick=False,
@@ -104,6 +154,32 @@ def test_json_encoder():
         ' "list": [{"value_int": 1, "value_str": "string"}, "America/Los_Angeles"]}'
     ) == encoded
 
+    # Encoding the same types again gives the same output
+    assert '["2022-06-02T22:19:34", "Europe/Berlin"]' == json.dumps(
+        [datetime.datetime(2022, 6, 2, 22, 19, 34), zoneinfo.ZoneInfo("Europe/Berlin")], cls=MyBMWJSONEncoder
+    )
+
+
+def test_json_encoder_properties():
+    """Test that the MyBMWJSONEncoder adds properties without modifying the object."""
+
+    class Example:
+        """Example class with attributes and properties."""
+
+        def __init__(self):
+            self.value = 1
+            self.account = "ignored"
+            self._cache = "ignored"
+
+        @property
+        def doubled(self) -> int:
+            """Return the doubled value."""
+            return self.value * 2
+
+    example = Example()
+    assert '{"value": 1, "doubled": 2}' == json.dumps(example, cls=MyBMWJSONEncoder)
+    assert {"value": 1, "account": "ignored", "_cache": "ignored"} == example.__dict__
+
 
 def test_charging_settings():
     """Test parsing and validation of charging settings."""
@@ -1,10 +1,12 @@
 """Tests for MyBMWVehicle."""
+from unittest import mock
+
 import pytest
 import respx
 
-from bimmer_connected.const import ATTR_ATTRIBUTES, ATTR_STATE, CarBrands
+from bimmer_connected.const import ATTR_ATTRIBUTES, ATTR_CAPABILITIES, ATTR_CHARGING_SETTINGS, ATTR_STATE, CarBrands
 from bimmer_connected.models import GPSPosition, StrEnum, VehicleDataBase
-from bimmer_connected.vehicle import VehicleViewDirection
+from bimmer_connected.vehicle import MyBMWVehicle, VehicleViewDirection
 from bimmer_connected.vehicle.const import DriveTrainType
 from bimmer_connected.vehicle.reports import CheckControlMessageReport
 
@@ -61,6 +63,35 @@ async def test_drive_train(caplog, bmw_fixture: respx.Router):
     assert len(get_deprecation_warning_count(caplog)) == 0
 
 
+@pytest.mark.asyncio
+async def test_combine_data_once_per_vehicle(bmw_fixture: respx.Router):
+    """Test that vehicle data is only combined once when creating a vehicle."""
+    account = await prepare_account_with_vehicles()
+    vehicle = account.get_vehicle(VIN_G26)
+
+    with mock.patch.object(MyBMWVehicle, "combine_data", wraps=MyBMWVehicle.combine_data) as mock_combine_data:
+        MyBMWVehicle(account, vehicle.data, vehicle.data, vehicle.data[ATTR_CHARGING_SETTINGS])
+    assert mock_combine_data.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_attributes(bmw_fixture: respx.Router):
+    """Test that a vehicle can be created if some attributes are missing."""
+    account = await prepare_account_with_vehicles()
+
+    vehicle = MyBMWVehicle(account, {"vin": "X", "attributes": {"brand": "BMW", "model": "i3"}})
+    assert DriveTrainType.UNKNOWN == vehicle.drive_train
+    assert vehicle.has_electric_drivetrain is False
+    assert vehicle.has_combustion_drivetrain is False
+
+    vehicle = MyBMWVehicle(account, {"vin": "X", "attributes": {"driveTrain": "ELECTRIC"}})
+    assert "X" == vehicle.vin
+    with pytest.raises(KeyError):
+        vehicle.brand
+    with pytest.raises(KeyError):
+        vehicle.name
+
+
 @pytest.mark.asyncio
 async def test_parsing_attributes(caplog, bmw_fixture: respx.Router):
     """Test parsing different attributes of the vehicle."""
@@ -136,16 +167,43 @@ async def test_get_is_tracking_enabled(caplog, bmw_fixture: respx.Router):
     assert len(get_deprecation_warning_count(caplog)) == 0
 
 
+@pytest.mark.asyncio
+async def test_capabilities(bmw_fixture: respx.Router):
+    """Test the capabilities of the vehicles."""
+    account = await prepare_account_with_vehicles()
+
+    capability_mapping = {
+        "is_charging_plan_supported": "isChargingPlanSupported",
+        "is_vehicle_tracking_enabled": "vehicleFinder",
+        "is_remote_set_target_soc_enabled": "isChargingTargetSocEnabled",
+        "is_remote_set_ac_limit_enabled": "isChargingPowerLimitEnabled",
+        "is_remote_sendpoi_enabled": "sendPoi",
+        "is_remote_horn_enabled": "horn",
+        "is_remote_lights_enabled": "lights",
+        "is_remote_lock_enabled": "lock",
+        "is_remote_unlock_enabled": "unlock",
+        "is_remote_climate_start_enabled": "climateNow",
+    }
+
+    for vehicle in account.vehicles:
+        for vehicle_attribute, capability in capability_mapping.items():
+            assert getattr(vehicle, vehicle_attribute) is vehicle.data[ATTR_CAPABILITIES].get(capability, False)
+
+        charging_control = vehicle.data[ATTR_CAPABILITIES].get("remoteChargingCommands", {}).get("chargingControl", [])
+        assert vehicle.is_remote_charge_start_enabled is ("START" in charging_control)
+        assert vehicle.is_remote_charge_stop_enabled is ("STOP" in charging_control)
+
+
 @pytest.mark.asyncio
 async def test_available_attributes(caplog, bmw_fixture: respx.Router):
     """Check that available_attributes returns exactly the arguments we have in our test data."""
     account = await prepare_account_with_vehicles()
 
     vehicle = account.get_vehicle(VIN_F31)
-    assert ["gps_position", "vin"] == vehicle.available_attributes
+    assert ("gps_position", "vin") == vehicle.available_attributes
 
     vehicle = account.get_vehicle(VIN_G01)
-    assert [
+    assert (
         "gps_position",
         "vin",
         "remaining_range_total",
@@ -173,10 +231,10 @@ async def test_available_attributes(caplog, bmw_fixture: respx.Router):
         "timestamp",
         "lids",
         "windows",
-    ] == vehicle.available_attributes
+    ) == vehicle.available_attributes
 
     vehicle = account.get_vehicle(VIN_G26)
-    assert [
+    assert (
         "gps_position",
         "vin",
         "remaining_range_total",
@@ -201,7 +259,7 @@ async def test_available_attributes(caplog, bmw_fixture: respx.Router):
         "timestamp",
         "lids",
         "windows",
-    ] == vehicle.available_attributes
+    ) == vehicle.available_attributes
 
     assert len(get_deprecation_warning_count(caplog)) == 0
 
@@ -241,9 +299,13 @@ def test_strenum(caplog):
 
     assert TestEnum("hello") == TestEnum.HELLO
     assert TestEnum("HELLO") == TestEnum.HELLO
+    assert TestEnum.from_value("hello") == TestEnum.HELLO
+    assert TestEnum.from_value("HELLO") == TestEnum.HELLO
 
     with pytest.raises(ValueError):
         TestEnum("WORLD")
+    with pytest.raises(ValueError):
+        TestEnum.from_value("WORLD")
 
     class TestEnumUnkown(StrEnum):
         """Test StrEnum with UNKNOWN value."""
@@ -7,8 +7,9 @@ import respx
 import time_machine
 
 from bimmer_connected.api.regions import get_region_from_name
+from bimmer_connected.vehicle.charging_profile import ChargingWindow, DepartureTimer
 from bimmer_connected.vehicle.climate import ClimateActivityState
-from bimmer_connected.vehicle.doors_windows import LidState, LockState
+from bimmer_connected.vehicle.doors_windows import DoorsAndWindows, LidState, LockState
 from bimmer_connected.vehicle.fuel_and_battery import ChargingState, FuelAndBattery
 from bimmer_connected.vehicle.location import VehicleLocation
 from bimmer_connected.vehicle.reports import CheckControlStatus, ConditionBasedServiceStatus
@@ -361,6 +362,36 @@ async def test_lids(caplog, bmw_fixture: respx.Router):
     assert len(get_deprecation_warning_count(caplog)) == 0
 
 
+def test_lids_open():
+    """Test parsing of open and invalid lids and windows."""
+    status = DoorsAndWindows.from_vehicle_data(
+        {
+            "state": {
+                "doorsState": {
+                    "combinedSecurityState": "unlocked",
+                    "combinedState": "OPEN",
+                    "hood": "CLOSED",
+                    "leftFront": "OPEN",
+                    "leftRear": "closed",
+                    "rightFront": "INVALID",
+                    "trunk": "OPEN",
+                },
+                "windowsState": {"combinedState": "CLOSED", "leftFront": "CLOSED", "rightFront": "INVALID"},
+            }
+        }
+    )
+
+    assert LockState.UNLOCKED == status.door_lock_state
+    assert ["hood", "leftFront", "leftRear", "trunk"] == [lid.name for lid in status.lids]
+    assert [LidState.CLOSED, LidState.OPEN, LidState.CLOSED, LidState.OPEN] == [lid.state for lid in status.lids]
+    assert ["leftFront", "trunk"] == [lid.name for lid in status.open_lids]
+    assert status.all_lids_closed is False
+
+    assert ["leftFront"] == [window.name for window in status.windows]
+    assert 0 == len(status.open_windows)
+    assert status.all_windows_closed is True
+
+
 @pytest.mark.asyncio
 async def test_windows_g01(caplog, bmw_fixture: respx.Router):
     """Test features around windows."""
@@ -448,6 +479,18 @@ async def test_charging_profile(caplog, bmw_fixture: respx.Router):
     assert len(get_deprecation_warning_count(caplog)) == 0
 
 
+def test_charging_profile_malformed_times():
+    """Test that incomplete times in the charging profile do not fail parsing."""
+
+    departure_timer = DepartureTimer({"id": 1, "timeStamp": {"hour": 7}})
+    assert departure_timer.timer_id == 1
+    assert departure_timer.start_time is None
+
+    charging_window = ChargingWindow({"start": {"minute": 1}, "end": {"hour": 1, "minute": 30}})
+    assert charging_window.start_time == datetime.time(0, 0)
+    assert charging_window.end_time == datetime.time(1, 30)
+
+
 @pytest.mark.asyncio
 async def test_charging_profile_format_for_remote_service(caplog, bmw_fixture: respx.Router):
     """Test formatting of the charging profile."""
@@ -2,13 +2,15 @@
 
 
 import datetime
+import functools
 import inspect
 import json
 import logging
 import pathlib
+import sys
 import time
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 from bimmer_connected.models import AnonymizedResponse
 
@@ -23,46 +25,178 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
-JSON_IGNORED_KEYS = ["account", "_account", "vehicle", "_vehicle", "status", "remote_services"]
+JSON_IGNORED_KEYS = frozenset(
+    {
+        "account",
+        "_account",
+        "vehicle",
+        "_vehicle",
+        "status",
+        "remote_services",
+    }
+)
 
 
-def get_class_property_names(obj: object):
+def get_class_property_names(obj: Any):
     """Return the names of all properties of a class."""
-    return [p[0] for p in inspect.getmembers(type(obj), inspect.isdatadescriptor) if not p[0].startswith("_")]
+    return list(_property_names_for(obj.__class__))
 
 
-def parse_datetime(date_str: str) -> Optional[datetime.datetime]:
+@functools.lru_cache(maxsize=None)
+def _property_names_for(cls: type) -> Tuple[str, ...]:
+    """Return the names of all properties of a class, cached per class."""
+    # Walk the MRO directly instead of using `inspect.getmembers()`, which calls `getattr()` for each member
+    names = []
+    seen = set()
+    for base in cls.__mro__:
+        for name, member in vars(base).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if not name.startswith("_") and _is_property(member):
+                names.append(name)
+    return tuple(sorted(names))
+
+
+def _is_property(obj: object) -> bool:
+    """Check if a class member is a property, including `functools.cached_property`."""
+    return inspect.isdatadescriptor(obj) or isinstance(obj, functools.cached_property)
+
+
+def parse_datetime(date_str: Optional[str]) -> Optional[datetime.datetime]:
     """Convert a time string into datetime."""
-    if not date_str:
+    # Also catch stringified `None` values passed by older callers
+    if not date_str or date_str == "None":
         return None
-    date_formats = ["%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ"]
-    for date_format in date_formats:
+    return _parse_cached(date_str)
+
+
+_DATE_FORMATS = ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ")
+_HAS_C_FROMISOFORMAT = sys.version_info >= (3, 11)
+
+
+def _is_ascii_digits(value: str) -> bool:
+    """Check that a string only consists of ASCII digits, as `str.isdigit()` also accepts other digits."""
+    return bool(value) and not value.strip("0123456789")
+
+
+def _fast_parse_iso(date_str: str) -> datetime.datetime:
+    """Parse the ISO-8601 variants used by the API without `strptime`.
+
+    Raises `ValueError` or `IndexError` if `date_str` is not in one of the supported formats.
+    """
+    if date_str[4] != "-" or date_str[7] != "-" or date_str[10] != "T" or date_str[13] != ":" or date_str[16] != ":":
+        raise ValueError(f"'{date_str}' is not an ISO-8601 datetime")
+    # `int()` also accepts whitespace, signs and non-ASCII digits, so all fields are checked first
+    digits = date_str[0:4] + date_str[5:7] + date_str[8:10] + date_str[11:13] + date_str[14:16] + date_str[17:19]
+    if len(digits) != 14 or not _is_ascii_digits(digits):
+        raise ValueError(f"'{date_str}' is not an ISO-8601 datetime")
+
+    # Fractional seconds are dropped, same as with `time.strptime`
+    tz_str = date_str[19:]
+    if tz_str[:1] == ".":
+        idx = 1
+        while idx < len(tz_str) and tz_str[idx] in "0123456789":
+            idx += 1
+        if not 1 < idx <= 7:
+            raise ValueError(f"'{date_str}' has invalid fractional seconds")
+        tz_str = tz_str[idx:]
+
+    if tz_str == "Z":
+        offset = datetime.timedelta(0)
+    elif (
+        len(tz_str) in (5, 6)
+        and tz_str[0] in "+-"
+        and (len(tz_str) == 5 or tz_str[3] == ":")
+        and _is_ascii_digits(tz_str[1:3] + tz_str[-2:])
+        and int(tz_str[-2:]) < 60
+    ):
+        offset = datetime.timedelta(hours=int(tz_str[1:3]), minutes=int(tz_str[-2:]))
+        if tz_str[0] == "-":
+            offset = -offset
+    else:
+        raise ValueError(f"'{date_str}' has invalid timezone information")
+
+    if _HAS_C_FROMISOFORMAT:
+        return datetime.datetime.fromisoformat(date_str).astimezone(datetime.timezone.utc).replace(microsecond=0)
+
+    parsed = datetime.datetime(
+        int(date_str[0:4]),
+        int(date_str[5:7]),
+        int(date_str[8:10]),
+        int(date_str[11:13]),
+        int(date_str[14:16]),
+        int(date_str[17:19]),
+        tzinfo=datetime.timezone.utc,
+    )
+    return parsed - offset
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_cached(date_str: str) -> Optional[datetime.datetime]:
+    """Parse a time string, falling back to `time.strptime` if the fast path does not match."""
+    try:
+        return _fast_parse_iso(date_str)
+    except (ValueError, IndexError):
+        pass
+
+    for date_format in _DATE_FORMATS:
         try:
             # Parse datetimes using `time.strptime` to allow running in some embedded python interpreters.
             # https://bugs.python.org/issue27400
             time_struct = time.strptime(date_str, date_format)
             parsed = datetime.datetime(*(time_struct[0:6]))
-            if time_struct.tm_gmtoff and time_struct.tm_gmtoff != 0:
+            if time_struct.tm_gmtoff:
                 parsed = parsed - datetime.timedelta(seconds=time_struct.tm_gmtoff)
-            parsed = parsed.replace(tzinfo=datetime.timezone.utc)
-            return parsed
+            return parsed.replace(tzinfo=datetime.timezone.utc)
         except ValueError:
             pass
-    _LOGGER.error("unable to parse '%s' using %s", date_str, date_formats)
+    _LOGGER.error("unable to parse '%s' using %s", date_str, _DATE_FORMATS)
     return None
 
 
+def _encode_datetime(o: Union[datetime.datetime, datetime.date, datetime.time]) -> str:
+    """Encode date and time objects as ISO-8601 string."""
+    return o.isoformat()
+
+
+def _encode_dataobj(o: Any) -> dict:
+    """Encode an object using its attributes and properties."""
+    retval = {k: v for k, v in o.__dict__.items() if not k.startswith("_") and k not in JSON_IGNORED_KEYS}
+    for prop in _property_names_for(o.__class__):
+        if prop not in JSON_IGNORED_KEYS:
+            retval[prop] = getattr(o, prop)
+    return retval
+
+
+def _encode_fallback(o: object) -> str:
+    """Encode any other object as string."""
+    return str(o)
+
+
 class MyBMWJSONEncoder(json.JSONEncoder):
     """JSON Encoder that handles data classes, properties and additional data types."""
 
+    _ENCODER_CACHE: Dict[type, Callable[[Any], Union[str, dict]]] = {}
+    """Encoding function resolved per concrete type."""
+
     def default(self, o) -> Union[str, dict]:  # noqa: D102
+        encoder = self._ENCODER_CACHE.get(type(o))
+        if encoder is None:
+            encoder = self._resolve_encoder(o)
+            self._ENCODER_CACHE[type(o)] = encoder
+        return encoder(o)
+
+    @staticmethod
+    def _resolve_encoder(o) -> Callable[[Any], Union[str, dict]]:
+        """Get the encoding function for the type of an object."""
         if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
-            return o.isoformat()
-        if not isinstance(o, Enum) and hasattr(o, "__dict__") and isinstance(o.__dict__, Dict):
-            retval: Dict = o.__dict__
-            retval.update({p: getattr(o, p) for p in get_class_property_names(o)})
-            return {k: v for k, v in retval.items() if k not in JSON_IGNORED_KEYS}
-        return str(o)
+            return _encode_datetime
+        if isinstance(o, Enum):
+            return _encode_fallback
+        if hasattr(o, "__dict__") and isinstance(o.__dict__, Dict):
+            return _encode_dataobj
+        return _encode_fallback
 
 
 def to_camel_case(input_str: str) -> str:
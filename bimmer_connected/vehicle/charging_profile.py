@@ -47,54 +47,35 @@ MAP_TIMER_TYPES_TO_REMOTE_SERVICE = {
 }
 
 
+def _parse_time(time_dict: Optional[Dict]) -> Optional[datetime.time]:
+    """Parse a time from API format, if both hour and minute are present."""
+    if not isinstance(time_dict, dict) or "hour" not in time_dict or "minute" not in time_dict:
+        return None
+    return datetime.time(int(time_dict["hour"]), int(time_dict["minute"]))
+
+
 class ChargingWindow:
     """A charging window."""
 
     def __init__(self, window_dict: dict):
-        self._window_dict = window_dict
-
-    @property
-    def start_time(self) -> datetime.time:
-        """Start of the charging window."""
-        if "start" not in self._window_dict:
-            return datetime.time(0, 0)
-        return datetime.time(int(self._window_dict["start"]["hour"]), int(self._window_dict["start"]["minute"]))
-
-    @property
-    def end_time(self) -> datetime.time:
-        """End of the charging window."""
-        if "end" not in self._window_dict:
-            return datetime.time(0, 0)
-        return datetime.time(int(self._window_dict["end"]["hour"]), int(self._window_dict["end"]["minute"]))
+        #: Start of the charging window.
+        self.start_time: datetime.time = _parse_time(window_dict.get("start")) or datetime.time(0, 0)
+        #: End of the charging window.
+        self.end_time: datetime.time = _parse_time(window_dict.get("end")) or datetime.time(0, 0)
 
 
 class DepartureTimer:
     """A departure timer."""
 
     def __init__(self, timer_dict: dict):
-        self._timer_dict: Dict = timer_dict
-
-    @property
-    def timer_id(self) -> Optional[int]:
-        """ID of this timer."""
-        return self._timer_dict.get("id")
-
-    @property
-    def start_time(self) -> Optional[datetime.time]:
-        """Deperture time for this timer."""
-        if "timeStamp" not in self._timer_dict:
-            return None
-        return datetime.time(int(self._timer_dict["timeStamp"]["hour"]), int(self._timer_dict["timeStamp"]["minute"]))
-
-    @property
-    def action(self) -> Optional[str]:
-        """What does the timer do."""
-        return self._timer_dict.get("action")
-
-    @property
-    def weekdays(self) -> List[str]:
-        """Active weekdays for this timer."""
-        return self._timer_dict.get("timerWeekDays")  # type: ignore[return-value]
+        #: ID of this timer.
+        self.timer_id: Optional[int] = timer_dict.get("id")
+        #: Deperture time for this timer.
+        self.start_time: Optional[datetime.time] = _parse_time(timer_dict.get("timeStamp"))
+        #: What does the timer do.
+        self.action: Optional[str] = timer_dict.get("action")
+        #: Active weekdays for this timer.
+        self.weekdays: List[str] = timer_dict.get("timerWeekDays")  # type: ignore[assignment]
 
 
 @dataclass
@@ -18,6 +18,9 @@ class ClimateActivityState(StrEnum):
     UNKNOWN = "UNKNOWN"
 
 
+_CLIMATE_ON_STATES = frozenset({ClimateActivityState.COOLING, ClimateActivityState.HEATING})
+
+
 @dataclass
 class Climate(VehicleDataBase):
     """Provides an accessible version of `state.climateControlState`."""
@@ -33,7 +36,7 @@ class Climate(VehicleDataBase):
     @property
     def is_climate_on(self) -> bool:
         """Return True if climatization is active."""
-        return self.activity in [ClimateActivityState.COOLING, ClimateActivityState.HEATING]
+        return self.activity in _CLIMATE_ON_STATES
 
     @property
     def activity_end_time(self) -> Optional[datetime.datetime]:
@@ -47,18 +50,13 @@ class Climate(VehicleDataBase):
         """Parse tire status."""
         retval: Dict[str, Any] = {}
 
-        if ATTR_STATE in vehicle_data:
-            if "climateControlState" in vehicle_data[ATTR_STATE]:
-                retval["activity"] = ClimateActivityState(vehicle_data[ATTR_STATE]["climateControlState"]["activity"])
-                retval["activity_end_time_no_tz"] = (
-                    (
-                        datetime.datetime.now()
-                        + datetime.timedelta(
-                            seconds=int(vehicle_data[ATTR_STATE]["climateControlState"]["remainingSeconds"])
-                        )
-                    )
-                    if "remainingSeconds" in vehicle_data[ATTR_STATE]["climateControlState"]
-                    else None
-                )
+        if ATTR_STATE in vehicle_data and "climateControlState" in vehicle_data[ATTR_STATE]:
+            climate_control_state = vehicle_data[ATTR_STATE]["climateControlState"]
+            retval["activity"] = ClimateActivityState(climate_control_state["activity"])
+            retval["activity_end_time_no_tz"] = (
+                (datetime.datetime.now() + datetime.timedelta(seconds=int(climate_control_state["remainingSeconds"])))
+                if "remainingSeconds" in climate_control_state
+                else None
+            )
 
         return retval
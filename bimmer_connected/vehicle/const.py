@@ -16,17 +16,21 @@ class DriveTrainType(StrEnum):
 
 
 #: Set of drive trains that have a combustion engine
-COMBUSTION_ENGINE_DRIVE_TRAINS = {
-    DriveTrainType.COMBUSTION,
-    DriveTrainType.ELECTRIC_WITH_RANGE_EXTENDER,
-    DriveTrainType.PLUGIN_HYBRID,
-    DriveTrainType.HYBRID,
-    DriveTrainType.MILD_HYBRID,
-}
+COMBUSTION_ENGINE_DRIVE_TRAINS = frozenset(
+    {
+        DriveTrainType.COMBUSTION,
+        DriveTrainType.ELECTRIC_WITH_RANGE_EXTENDER,
+        DriveTrainType.PLUGIN_HYBRID,
+        DriveTrainType.HYBRID,
+        DriveTrainType.MILD_HYBRID,
+    }
+)
 
 #: set of drive trains that have a high voltage battery
-HV_BATTERY_DRIVE_TRAINS = {
-    DriveTrainType.PLUGIN_HYBRID,
-    DriveTrainType.ELECTRIC,
-    DriveTrainType.ELECTRIC_WITH_RANGE_EXTENDER,
-}
+HV_BATTERY_DRIVE_TRAINS = frozenset(
+    {
+        DriveTrainType.PLUGIN_HYBRID,
+        DriveTrainType.ELECTRIC,
+        DriveTrainType.ELECTRIC_WITH_RANGE_EXTENDER,
+    }
+)
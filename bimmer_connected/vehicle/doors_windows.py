@@ -33,6 +33,12 @@ class LockState(StrEnum):
     UNKNOWN = "UNKNOWN"
 
 
+_LID_STATE_INVALID = LidState.INVALID.value
+# Summary entries in `doorsState` and `windowsState` that are not lids/windows
+_DOORS_STATE_SUMMARY_KEYS = frozenset({"combinedState", "combinedSecurityState"})
+_WINDOWS_STATE_SUMMARY_KEYS = frozenset({"combinedState"})
+
+
 class Lid:
     """A lid of the vehicle.
 
@@ -42,12 +48,12 @@ class Lid:
     def __init__(self, name: str, state: str):
         #: name of the lid
         self.name = name
-        self.state = LidState(state)
+        self.state = LidState.from_value(state)
 
     @property
     def is_closed(self) -> bool:
         """Check if the lid is closed."""
-        return self.state == LidState.CLOSED
+        return self.state is LidState.CLOSED
 
 
 class Window(Lid):
@@ -76,30 +82,28 @@ class DoorsAndWindows(VehicleDataBase):
         retval: Dict[str, Any] = {}
 
         if ATTR_STATE in vehicle_data:
-            if "doorsState" in vehicle_data[ATTR_STATE]:
+            state = vehicle_data[ATTR_STATE]
+
+            if "doorsState" in state:
+                doors_state = state["doorsState"]
                 retval["lids"] = [
                     Lid(k, v)
-                    for k, v in vehicle_data[ATTR_STATE]["doorsState"].items()
-                    if k not in ["combinedState", "combinedSecurityState"] and v != LidState.INVALID
+                    for k, v in doors_state.items()
+                    if k not in _DOORS_STATE_SUMMARY_KEYS and v != _LID_STATE_INVALID
                 ]
-                retval["door_lock_state"] = LockState(
-                    vehicle_data[ATTR_STATE]["doorsState"].get("combinedSecurityState", "UNKNOWN")
-                )
+                lock_state = doors_state.get("combinedSecurityState", "UNKNOWN")
+                retval["door_lock_state"] = LockState.from_value(lock_state)
 
-            if "windowsState" in vehicle_data[ATTR_STATE]:
+            if "windowsState" in state:
                 retval["windows"] = [
                     Window(k, v)
-                    for k, v in vehicle_data[ATTR_STATE]["windowsState"].items()
-                    if k not in ["combinedState"] and v != LidState.INVALID
+                    for k, v in state["windowsState"].items()
+                    if k not in _WINDOWS_STATE_SUMMARY_KEYS and v != _LID_STATE_INVALID
                 ]
 
-            if "roofState" in vehicle_data[ATTR_STATE]:
-                retval["lids"].append(
-                    Lid(
-                        to_camel_case(vehicle_data[ATTR_STATE]["roofState"]["roofStateType"]),
-                        vehicle_data[ATTR_STATE]["roofState"]["roofState"],
-                    )
-                )
+            if "roofState" in state:
+                roof_state = state["roofState"]
+                retval["lids"].append(Lid(to_camel_case(roof_state["roofStateType"]), roof_state["roofState"]))
 
         return retval
 
@@ -111,7 +115,7 @@ class DoorsAndWindows(VehicleDataBase):
     @property
     def all_lids_closed(self) -> bool:
         """Check if all lids are closed."""
-        return len(self.open_lids) == 0
+        return all(lid.is_closed for lid in self.lids)
 
     @property
     def open_windows(self) -> List[Window]:
@@ -121,4 +125,4 @@ class DoorsAndWindows(VehicleDataBase):
     @property
     def all_windows_closed(self) -> bool:
         """Check if all windows are closed."""
-        return len(self.open_windows) == 0
+        return all(window.is_closed for window in self.windows)
@@ -12,6 +12,9 @@ from bimmer_connected.vehicle.const import COMBUSTION_ENGINE_DRIVE_TRAINS, HV_BA
 
 _LOGGER = logging.getLogger(__name__)
 
+# Drive trains with both a combustion engine and a high voltage battery
+_HYBRID_DRIVE_TRAINS = COMBUSTION_ENGINE_DRIVE_TRAINS & HV_BATTERY_DRIVE_TRAINS
+
 
 class ChargingState(StrEnum):
     """Charging state of electric vehicle."""
@@ -92,14 +95,10 @@ class FuelAndBattery(VehicleDataBase):
         drivetrain = DriveTrainType(vehicle_data.get(ATTR_ATTRIBUTES, {}).get("driveTrain") or DriveTrainType.UNKNOWN)
 
         # return early if state data hasn't been loaded or no combustion/electric data is available
-        if (
-            ATTR_STATE not in vehicle_data
-            or len({"combustionFuelLevel", "electricChargingState"}.intersection(set(vehicle_data[ATTR_STATE]))) == 0
-        ):
+        state = vehicle_data.get(ATTR_STATE)
+        if not state or ("combustionFuelLevel" not in state and "electricChargingState" not in state):
             return retval
 
-        state = vehicle_data["state"]
-
         if drivetrain in COMBUSTION_ENGINE_DRIVE_TRAINS:
             retval.update(cls._parse_fuel_data(state.get("combustionFuelLevel", {}), vehicle_data["is_metric"]))
 
@@ -115,7 +114,7 @@ class FuelAndBattery(VehicleDataBase):
                     ),
                 )
 
-        if drivetrain in set(COMBUSTION_ENGINE_DRIVE_TRAINS).intersection(HV_BATTERY_DRIVE_TRAINS):
+        if drivetrain in _HYBRID_DRIVE_TRAINS:
             # for hybrid vehicles the remaining_range_fuel returned by the API seems to be the total remaining range
             # to calculate the correct remaining range on fuel, we have to subtract the remaining electric range
             # this does not seem to apply for the old I3 with range extender
@@ -166,9 +165,10 @@ class FuelAndBattery(VehicleDataBase):
         if "range" in electric_data:
             retval["remaining_range_electric"] = ValueWithUnit(electric_data["range"], "km" if is_metric else "mi")
         if "chargingStatus" in electric_data:
-            retval["charging_status"] = ChargingState(
+            charging_status = (
                 electric_data["chargingStatus"] if electric_data["chargingStatus"] != "INVALID" else "NOT_CHARGING"
             )
+            retval["charging_status"] = ChargingState.from_value(charging_status)
         if "remainingChargingMinutes" in electric_data:
             retval["charging_end_time"] = fetched_at + datetime.timedelta(
                 minutes=electric_data["remainingChargingMinutes"]
@@ -43,7 +43,7 @@ class ConditionBasedService:
         """Parse a condition based service entry from the API format to `ConditionBasedService`."""
         due_distance = ValueWithUnit(mileage, "km" if is_metric else "mi") if mileage else ValueWithUnit(None, None)
         due_date = parse_datetime(dateTime) if dateTime else None
-        return cls(type, ConditionBasedServiceStatus(status), due_date, due_distance)
+        return cls(type, ConditionBasedServiceStatus.from_value(status), due_date, due_distance)
 
 
 @dataclass
@@ -93,7 +93,7 @@ class CheckControlMessage:
     @classmethod
     def from_api_entry(cls, type: str, severity: str, longDescription: Optional[str] = None, **kwargs):
         """Parse a check control entry from the API format to `CheckControlMessage`."""
-        return cls(type, longDescription, CheckControlStatus(severity))
+        return cls(type, longDescription, CheckControlStatus.from_value(severity))
 
 
 @dataclass
@@ -114,7 +114,7 @@ class CheckControlMessageReport(VehicleDataBase):
         if ATTR_STATE in vehicle_data and "checkControlMessages" in vehicle_data[ATTR_STATE]:
             messages = vehicle_data[ATTR_STATE]["checkControlMessages"]
             retval["messages"] = [CheckControlMessage.from_api_entry(**m) for m in messages if m["severity"] != "OK"]
-            retval["has_check_control_messages"] = len([m for m in retval["messages"] if m.state != "LOW"]) > 0
+            retval["has_check_control_messages"] = any(m.state != CheckControlStatus.LOW for m in retval["messages"])
 
         return retval
 
@@ -138,13 +138,15 @@ class Headunit(VehicleDataBase):
         retval: Dict[str, Any] = {}
 
         if ATTR_ATTRIBUTES in vehicle_data and "softwareVersionCurrent" in vehicle_data[ATTR_ATTRIBUTES]:
-            retval["idrive_version"] = vehicle_data[ATTR_ATTRIBUTES]["hmiVersion"]
-            retval["headunit_type"] = vehicle_data[ATTR_ATTRIBUTES]["headUnitType"]
-
-            istep = vehicle_data[ATTR_ATTRIBUTES]["softwareVersionCurrent"]["iStep"]
-            month = vehicle_data[ATTR_ATTRIBUTES]["softwareVersionCurrent"]["puStep"]["month"]
-            year = vehicle_data[ATTR_ATTRIBUTES]["softwareVersionCurrent"]["puStep"]["year"]
-            model_year = vehicle_data[ATTR_ATTRIBUTES]["year"]
+            attributes = vehicle_data[ATTR_ATTRIBUTES]
+            retval["idrive_version"] = attributes["hmiVersion"]
+            retval["headunit_type"] = attributes["headUnitType"]
+
+            software_version = attributes["softwareVersionCurrent"]
+            istep = software_version["iStep"]
+            month = software_version["puStep"]["month"]
+            year = software_version["puStep"]["year"]
+            model_year = attributes["year"]
 
             retval["software_version"] = f"{month:02d}/{str(model_year)[:2]}{year:02d}.{str(istep)[1:]}"
 
@@ -1,7 +1,8 @@
 """Models state and remote services of one vehicle."""
 import datetime
+import functools
 import logging
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, ClassVar, Dict, Optional, Tuple, Type
 
 from bimmer_connected.api.client import MyBMWClient
 from bimmer_connected.const import (
@@ -31,6 +32,20 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+#: Boolean capabilities of a vehicle as provided by the server
+_CAPABILITY_FLAGS = (
+    "isChargingPlanSupported",
+    "vehicleFinder",
+    "isChargingTargetSocEnabled",
+    "isChargingPowerLimitEnabled",
+    "sendPoi",
+    "horn",
+    "lights",
+    "lock",
+    "unlock",
+    "climateNow",
+)
+
 
 class VehicleViewDirection(StrEnum):
     """Viewing angles for the vehicle.
@@ -68,6 +83,19 @@ class MyBMWVehicle:
     :param attributes: attributes of the vehicle as provided by the server
     """
 
+    _UPDATE_ENTITIES: ClassVar[Tuple[Tuple[Type["VehicleDataBase"], str], ...]] = (
+        (FuelAndBattery, "fuel_and_battery"),
+        (VehicleLocation, "vehicle_location"),
+        (DoorsAndWindows, "doors_and_windows"),
+        (ConditionBasedServiceReport, "condition_based_services"),
+        (CheckControlMessageReport, "check_control_messages"),
+        (Headunit, "headunit"),
+        (Climate, "climate"),
+        (ChargingProfile, "charging_profile"),
+        (Tires, "tires"),
+    )
+    """Vehicle attributes and their data classes, updated in `update_state`."""
+
     def __init__(
         self,
         account: "MyBMWAccount",
@@ -78,7 +106,7 @@ class MyBMWVehicle:
     ) -> None:
         """Initialize a MyBMWVehicle."""
         self.account = account
-        self.data = self.combine_data(account, vehicle_base, vehicle_state, charging_settings, fetched_at)
+        self.data: Dict = {}
         self.remote_services = RemoteServices(self)
         self.fuel_and_battery: FuelAndBattery = FuelAndBattery(account_timezone=account.timezone)
         self.vehicle_location: VehicleLocation = VehicleLocation(account_region=account.region)
@@ -102,25 +130,27 @@ class MyBMWVehicle:
         """Update the state of a vehicle."""
         vehicle_data = self.combine_data(self.account, vehicle_base, vehicle_state, charging_settings, fetched_at)
         self.data = vehicle_data
+        # Resolved on first access, as the attributes might be missing
+        self._brand: Optional[CarBrands] = None
+        self._name: Optional[str] = None
+        self._drive_train = DriveTrainType(
+            vehicle_data.get(ATTR_ATTRIBUTES, {}).get("driveTrain") or DriveTrainType.UNKNOWN
+        )
+        capabilities = vehicle_data.get(ATTR_CAPABILITIES, {})
+        self._enabled_capabilities = frozenset(c for c in _CAPABILITY_FLAGS if capabilities.get(c))
+        self._charging_controls = frozenset(capabilities.get("remoteChargingCommands", {}).get("chargingControl", ()))
 
-        update_entities: List[Tuple[Type["VehicleDataBase"], str]] = [
-            (FuelAndBattery, "fuel_and_battery"),
-            (VehicleLocation, "vehicle_location"),
-            (DoorsAndWindows, "doors_and_windows"),
-            (ConditionBasedServiceReport, "condition_based_services"),
-            (CheckControlMessageReport, "check_control_messages"),
-            (Headunit, "headunit"),
-            (Climate, "climate"),
-            (ChargingProfile, "charging_profile"),
-            (Tires, "tires"),
-        ]
-        for cls, vehicle_attribute in update_entities:
+        for cls, vehicle_attribute in self._UPDATE_ENTITIES:
             if getattr(self, vehicle_attribute) is None:
                 setattr(self, vehicle_attribute, cls.from_vehicle_data(vehicle_data))
             else:
                 curr_attr: "VehicleDataBase" = getattr(self, vehicle_attribute)
                 curr_attr.update_from_vehicle_data(vehicle_data)
 
+        # Computed on first access as not all data might be available yet
+        self._drive_train_attributes: Optional[Tuple[str, ...]] = None
+        self._available_attributes: Optional[Tuple[str, ...]] = None
+
     @staticmethod
     def combine_data(
         account: "MyBMWAccount",
@@ -130,13 +160,13 @@ class MyBMWVehicle:
         fetched_at: Optional[datetime.datetime] = None,
     ) -> Dict:
         """Combine API responses and additional information to a single dictionary."""
-        return {
-            **vehicle_base,
-            **(vehicle_state or {}),
-            ATTR_CHARGING_SETTINGS: charging_settings or {},
-            "is_metric": account.config.use_metric_units,
-            "fetched_at": fetched_at or datetime.datetime.now(datetime.timezone.utc),
-        }
+        combined = dict(vehicle_base)
+        if vehicle_state:
+            combined.update(vehicle_state)
+        combined[ATTR_CHARGING_SETTINGS] = charging_settings or {}
+        combined["is_metric"] = account.config.use_metric_units
+        combined["fetched_at"] = fetched_at if fetched_at is not None else datetime.datetime.now(datetime.timezone.utc)
+        return combined
 
     # # # # # # # # # # # # # # #
     # Generic attributes
@@ -145,14 +175,18 @@ class MyBMWVehicle:
     @property
     def brand(self) -> CarBrands:
         """Get the car brand."""
-        return CarBrands(self.data[ATTR_ATTRIBUTES]["brand"])
+        if self._brand is None:
+            self._brand = CarBrands(self.data[ATTR_ATTRIBUTES]["brand"])
+        return self._brand
 
     @property
     def name(self) -> str:
         """Get the name of the vehicle."""
-        return self.data[ATTR_ATTRIBUTES]["model"]
+        if self._name is None:
+            self._name = self.data[ATTR_ATTRIBUTES]["model"]
+        return self._name
 
-    @property
+    @functools.cached_property
     def vin(self) -> str:
         """Get the VIN (vehicle identification number) of the vehicle."""
         return self.data["vin"]
@@ -160,7 +194,7 @@ class MyBMWVehicle:
     @property
     def drive_train(self) -> DriveTrainType:
         """Get the type of drive train of the vehicle."""
-        return DriveTrainType(self.data[ATTR_ATTRIBUTES]["driveTrain"])
+        return self._drive_train
 
     @property
     def mileage(self) -> ValueWithUnit:
@@ -170,17 +204,11 @@ class MyBMWVehicle:
     @property
     def timestamp(self) -> Optional[datetime.datetime]:
         """Get the timestamp when the data was recorded."""
-        timestamps = [
-            ts
-            for ts in [
-                parse_datetime(str(self.data[ATTR_ATTRIBUTES].get("lastFetched"))),
-                parse_datetime(str(self.data[ATTR_STATE].get("lastFetched"))),
-            ]
-            if ts
-        ]
-        if len(timestamps) == 0:
-            return None
-        return max(timestamps)
+        ts_attributes = parse_datetime(self.data[ATTR_ATTRIBUTES].get("lastFetched"))
+        ts_state = parse_datetime(self.data[ATTR_STATE].get("lastFetched"))
+        if ts_attributes and ts_state:
+            return ts_attributes if ts_attributes > ts_state else ts_state
+        return ts_attributes or ts_state
 
     # # # # # # # # # # # # # # #
     # Capabilities & properties
@@ -192,7 +220,7 @@ class MyBMWVehicle:
 
         In this case we can get the state of the battery in the state attributes.
         """
-        return self.drive_train in HV_BATTERY_DRIVE_TRAINS
+        return self._drive_train in HV_BATTERY_DRIVE_TRAINS
 
     @property
     def has_combustion_drivetrain(self) -> bool:
@@ -200,17 +228,17 @@ class MyBMWVehicle:
 
         In this case we can get the state of the gas tank.
         """
-        return self.drive_train in COMBUSTION_ENGINE_DRIVE_TRAINS
+        return self._drive_train in COMBUSTION_ENGINE_DRIVE_TRAINS
 
     @property
     def is_charging_plan_supported(self) -> bool:
         """Return True if charging profile is available and can be set via API."""
-        return self.data[ATTR_CAPABILITIES].get("isChargingPlanSupported", False)
+        return "isChargingPlanSupported" in self._enabled_capabilities
 
     @property
     def is_vehicle_tracking_enabled(self) -> bool:
         """Return True if vehicle finder is enabled in vehicle."""
-        return self.data[ATTR_CAPABILITIES].get("vehicleFinder", False)
+        return "vehicleFinder" in self._enabled_capabilities
 
     @property
     def is_vehicle_active(self) -> bool:
@@ -239,42 +267,42 @@ class MyBMWVehicle:
     @property
     def is_remote_set_target_soc_enabled(self) -> bool:
         """Return True if Target SoC can be set via the API."""
-        return self.data[ATTR_CAPABILITIES].get("isChargingTargetSocEnabled", False)
+        return "isChargingTargetSocEnabled" in self._enabled_capabilities
 
     @property
     def is_remote_set_ac_limit_enabled(self) -> bool:
         """Return True if AC limit can be set via the API."""
-        return self.data[ATTR_CAPABILITIES].get("isChargingPowerLimitEnabled", False)
+        return "isChargingPowerLimitEnabled" in self._enabled_capabilities
 
     @property
     def is_remote_sendpoi_enabled(self) -> bool:
         """Return True if POIs can be set via the API."""
-        return self.data[ATTR_CAPABILITIES].get("sendPoi", False)
+        return "sendPoi" in self._enabled_capabilities
 
     @property
     def is_remote_horn_enabled(self) -> bool:
         """Return True if the horn can be activated via the API."""
-        return self.data[ATTR_CAPABILITIES].get("horn", False)
+        return "horn" in self._enabled_capabilities
 
     @property
     def is_remote_lights_enabled(self) -> bool:
         """Return True if the lights can be activated via the API."""
-        return self.data[ATTR_CAPABILITIES].get("lights", False)
+        return "lights" in self._enabled_capabilities
 
     @property
     def is_remote_lock_enabled(self) -> bool:
         """Return True if vehicle can be locked via the API."""
-        return self.data[ATTR_CAPABILITIES].get("lock", False)
+        return "lock" in self._enabled_capabilities
 
     @property
     def is_remote_unlock_enabled(self) -> bool:
         """Return True if POIs can be unlocked via the API."""
-        return self.data[ATTR_CAPABILITIES].get("unlock", False)
+        return "unlock" in self._enabled_capabilities
 
     @property
     def is_remote_climate_start_enabled(self) -> bool:
         """Return True if AC/ventilation can be started via the API."""
-        return self.data[ATTR_CAPABILITIES].get("climateNow", False)
+        return "climateNow" in self._enabled_capabilities
 
     @property
     def is_remote_climate_stop_enabled(self) -> bool:
@@ -284,22 +312,35 @@ class MyBMWVehicle:
     @property
     def is_remote_charge_start_enabled(self) -> bool:
         """Return True if charging can be started via the API."""
-        return "START" in self.data[ATTR_CAPABILITIES].get("remoteChargingCommands", {}).get("chargingControl", [])
+        return "START" in self._charging_controls
 
     @property
     def is_remote_charge_stop_enabled(self) -> bool:
         """Return True if charging can be stop via the API."""
-        return "STOP" in self.data[ATTR_CAPABILITIES].get("remoteChargingCommands", {}).get("chargingControl", [])
+        return "STOP" in self._charging_controls
 
     @property
-    def drive_train_attributes(self) -> List[str]:
-        """Get list of attributes available for the drive train of the vehicle.
+    def drive_train_attributes(self) -> Tuple[str, ...]:
+        """Get a tuple of attributes available for the drive train of the vehicle.
 
-        The list of available attributes depends if on the type of drive train.
+        The available attributes depend on the type of drive train.
         Some attributes only exist for electric/hybrid vehicles, others only if you
         have a combustion engine. Depending on the state of the vehicle, some of
         the attributes might still be None.
         """
+        if self._drive_train_attributes is None:
+            self._drive_train_attributes = self._get_drive_train_attributes()
+        return self._drive_train_attributes
+
+    @property
+    def available_attributes(self) -> Tuple[str, ...]:
+        """Get a tuple of non-drivetrain attributes available for this vehicle."""
+        if self._available_attributes is None:
+            self._available_attributes = self._get_available_attributes()
+        return self._available_attributes
+
+    def _get_drive_train_attributes(self) -> Tuple[str, ...]:
+        """Get attributes available for the drive train of the vehicle, see `drive_train_attributes`."""
         result = ["remaining_range_total", "mileage"]
         if self.has_electric_drivetrain:
             result += [
@@ -320,11 +361,10 @@ class MyBMWVehicle:
             ]
         if self.has_combustion_drivetrain:
             result += ["remaining_fuel", "remaining_range_fuel", "remaining_fuel_percent"]
-        return result
+        return tuple(result)
 
-    @property
-    def available_attributes(self) -> List[str]:
-        """Get the list of non-drivetrain attributes available for this vehicle."""
+    def _get_available_attributes(self) -> Tuple[str, ...]:
+        """Get the non-drivetrain attributes available for this vehicle, see `available_attributes`."""
         # attributes available in all vehicles
         result = ["gps_position", "vin"]
         if self.is_lsc_enabled:
@@ -338,7 +378,7 @@ class MyBMWVehicle:
             ]
             # required for existing Home Assistant binary sensors
             result += ["lids", "windows"]
-        return result
+        return tuple(result)
 
     # # # # # # # # # # # # # # #
     # Generic functions